@@ -3,9 +3,26 @@
 
 import asyncio
 from collections.abc import AsyncIterator
+from typing import TypeVar
 
 from aio_usb.discovery import UsbDeviceInfo
 
+_T = TypeVar("_T")
+
+
+async def _get_batch(queue: asyncio.Queue[_T]) -> list[_T]:
+    """
+    Waits for an item in a queue and then also takes any other queued items.
+    """
+    batch = [await queue.get()]
+    append = batch.append
+    get_nowait = queue.get_nowait
+
+    while not queue.empty():
+        append(get_nowait())
+
+    return batch
+
 
 class UsbMonitor:
     def __init__(
@@ -29,3 +46,22 @@ class UsbMonitor:
         """
         while True:
             yield await self._removed.get()
+
+    async def added_batches(self) -> AsyncIterator[list[UsbDeviceInfo]]:
+        """
+        Like :meth:`added` but yields all devices connected since the previous
+        iteration at once.
+
+        This is useful when many devices are connected at the same time, e.g.
+        when a hub is plugged in, to handle them together.
+        """
+        while True:
+            yield await _get_batch(self._added)
+
+    async def removed_batches(self) -> AsyncIterator[list[str]]:
+        """
+        Like :meth:`removed` but yields all devices disconnected since the
+        previous iteration at once.
+        """
+        while True:
+            yield await _get_batch(self._removed)
@@ -33,20 +33,18 @@ from aio_usb.backend.rubicon_objc.io_kit import (
 )
 from aio_usb.backend.rubicon_objc.io_kit.usb.apple_usb_definitions import (
     IOUSBConfigurationDescriptorPtr,
-    IOUSBDescriptorHeaderPtr,
     IOUSBDeviceRequest,
-    IOUSBEndpointDescriptorPtr,
+    IOUSBEndpointDescriptor,
     IOUSBInterfaceDescriptorPtr,
 )
 from aio_usb.backend.rubicon_objc.io_usb_host import (
-    IOUSBGetNextEndpointDescriptor,
     IOUSBHostAbortOption,
     IOUSBHostDevice,
     IOUSBHostInterface,
     IOUSBHostPipe,
 )
-from aio_usb.backend.rubicon_objc.runtime import NSErrorError, mach_error_string
-from aio_usb.ch9 import UsbControlRequest
+from aio_usb.backend.rubicon_objc.runtime import NSErrorError, mach_error
+from aio_usb.ch9 import UsbControlRequest, UsbDescriptorType
 from aio_usb.device import UsbDevice
 from aio_usb.discovery import UsbDeviceInfo
 from aio_usb.interface import UsbInterface
@@ -55,32 +53,55 @@ from aio_usb.pipe import UsbInPipe, UsbOutPipe
 
 def _marshal_device_info(service: IOService) -> UsbDeviceInfo:
     entry = service.as_(IORegistryEntry)
-    props = entry.properties
+    # Only a few properties are needed, so don't convert the whole table.
+    get_property = entry.get_property
 
     return UsbDeviceInfo(
         device_id=str(entry.id),
         name=entry.name,
-        vendor_id=props["idVendor"],
-        product_id=props["idProduct"],
-        class_=props["bDeviceClass"],
-        subclass=props["bDeviceSubClass"],
-        protocol=props["bDeviceProtocol"],
+        vendor_id=get_property("idVendor"),
+        product_id=get_property("idProduct"),
+        class_=get_property("bDeviceClass"),
+        subclass=get_property("bDeviceSubClass"),
+        protocol=get_property("bDeviceProtocol"),
     )
 
 
 def _iterate_endpoint_descriptors(
     cfg_desc: IOUSBConfigurationDescriptorPtr,
     iface_desc: IOUSBInterfaceDescriptorPtr,
-) -> Iterable[IOUSBEndpointDescriptorPtr]:
-    ep_desc = IOUSBGetNextEndpointDescriptor(cfg_desc, iface_desc, None)
-    while ep_desc:
-        yield ep_desc
-
-        ep_desc = IOUSBGetNextEndpointDescriptor(
-            cfg_desc,
-            iface_desc,
-            ctypes.cast(ep_desc, IOUSBDescriptorHeaderPtr),
-        )
+) -> Iterable[IOUSBEndpointDescriptor]:
+    # Walk the configuration descriptor in Python instead of making a ctypes
+    # call to IOUSBGetNextEndpointDescriptor() for each descriptor.
+    cfg_addr = ctypes.addressof(cfg_desc.contents)
+    data = ctypes.string_at(cfg_addr, cfg_desc.contents.wTotalLength)
+    end = len(data)
+
+    offset = ctypes.addressof(iface_desc.contents) - cfg_addr
+
+    if not 0 <= offset < end:
+        # interface descriptor is not part of the configuration descriptor
+        return
+
+    offset += data[offset]
+
+    while offset + 2 <= end:
+        length = data[offset]
+
+        if length < 2 or offset + length > end:
+            # malformed descriptor
+            break
+
+        desc_type = data[offset + 1]
+
+        # Endpoints belong to the interface until the next interface descriptor.
+        if desc_type == UsbDescriptorType.INTERFACE:
+            break
+
+        if desc_type == UsbDescriptorType.ENDPOINT:
+            yield IOUSBEndpointDescriptor.from_address(cfg_addr + offset)
+
+        offset += length
 
 
 class RubiconObjCUsbInPipe(UsbBackendInPipe):
@@ -94,7 +115,7 @@ class RubiconObjCUsbInPipe(UsbBackendInPipe):
 
         def on_complete(status: int, bytesTransferred: int) -> None:
             if status:
-                future.set_exception(OSError(status, mach_error_string(status)))
+                future.set_exception(mach_error(status))
             else:
                 future.set_result(bytesTransferred)
 
@@ -154,7 +175,7 @@ class RubiconObjCUsbOutPipe(UsbBackendOutPipe):
 
         def on_complete(status: int, bytesTransferred: int) -> None:
             if status:
-                future.set_exception(OSError(status, mach_error_string(status)))
+                future.set_exception(mach_error(status))
             else:
                 future.set_result(bytesTransferred)
 
@@ -211,13 +232,13 @@ async def _open_in_pipe(iface: IOUSBHostInterface) -> AsyncGenerator[Any, UsbInP
         iface.configurationDescriptor,
         iface.interfaceDescriptor,
     ):
-        if (ep_desc.contents.bEndpointAddress & 0x80) == 0x80:
+        if (ep_desc.bEndpointAddress & 0x80) == 0x80:
             break
     else:
         raise ValueError("No such endpoint for direction in")
 
     error = objc_id()
-    pipe = iface.copyPipeWithAddress(ep_desc.contents.bEndpointAddress, error=error)
+    pipe = iface.copyPipeWithAddress(ep_desc.bEndpointAddress, error=error)
     if pipe is None:
         raise NSErrorError(error)
 
@@ -230,13 +251,13 @@ async def _open_out_pipe(iface: IOUSBHostInterface) -> AsyncGenerator[Any, UsbOu
         iface.configurationDescriptor,
         iface.interfaceDescriptor,
     ):
-        if (ep_desc.contents.bEndpointAddress & 0x80) == 0x00:
+        if (ep_desc.bEndpointAddress & 0x80) == 0x00:
             break
     else:
         raise ValueError("No such endpoint for direction out")
 
     error = objc_id()
-    pipe = iface.copyPipeWithAddress(ep_desc.contents.bEndpointAddress, error=error)
+    pipe = iface.copyPipeWithAddress(ep_desc.bEndpointAddress, error=error)
     if pipe is None:
         raise NSErrorError(error)
 
@@ -246,31 +267,35 @@ async def _open_out_pipe(iface: IOUSBHostInterface) -> AsyncGenerator[Any, UsbOu
 class RubiconObjCUsbInterface(UsbBackendInterface):
     def __init__(self, iface: IOUSBHostInterface) -> None:
         self._iface = iface
+        # The descriptor doesn't change while the interface is open, so avoid
+        # an Objective-C message send each time a property is read. The
+        # memory is owned by iface, which is kept alive by self._iface.
+        self._desc = iface.interfaceDescriptor.contents
 
     @property
     @override
     def interface_number(self) -> int:
-        return self._iface.interfaceDescriptor.contents.bInterfaceNumber
+        return self._desc.bInterfaceNumber
 
     @property
     @override
     def alternate_setting(self) -> int:
-        return self._iface.interfaceDescriptor.contents.bAlternateSetting
+        return self._desc.bAlternateSetting
 
     @property
     @override
     def interface_class(self) -> int:
-        return self._iface.interfaceDescriptor.contents.bInterfaceClass
+        return self._desc.bInterfaceClass
 
     @property
     @override
     def interface_subclass(self) -> int:
-        return self._iface.interfaceDescriptor.contents.bInterfaceSubClass
+        return self._desc.bInterfaceSubClass
 
     @property
     @override
     def interface_protocol(self) -> int:
-        return self._iface.interfaceDescriptor.contents.bInterfaceProtocol
+        return self._desc.bInterfaceProtocol
 
     @property
     @override
@@ -353,10 +378,27 @@ async def _open_interface(
         iface.destroy()
 
 
+# Registry properties used by RubiconObjCUsbDevice.
+_DEVICE_PROPERTY_KEYS = (
+    "idVendor",
+    "idProduct",
+    "bcdDevice",
+    "bcdUSB",
+    "bDeviceClass",
+    "bDeviceSubClass",
+    "bDeviceProtocol",
+    "kUSBVendorString",
+    "kUSBProductString",
+    "kUSBSerialNumberString",
+)
+
+
 class RubiconObjCUsbDevice(UsbBackendDevice):
     def __init__(self, device: IOUSBHostDevice) -> None:
         self._device = device
-        self._properties = IORegistryEntry.from_handle(device.ioService).properties
+        # Only convert the properties we use instead of the whole property table.
+        get_property = IORegistryEntry.from_handle(device.ioService).get_property
+        self._properties = {key: get_property(key) for key in _DEVICE_PROPERTY_KEYS}
 
     @property
     @override
@@ -396,17 +438,17 @@ class RubiconObjCUsbDevice(UsbBackendDevice):
     @property
     @override
     def manufacturer_name(self) -> str | None:
-        return self._properties.get("kUSBVendorString")
+        return self._properties["kUSBVendorString"]
 
     @property
     @override
     def product_name(self) -> str | None:
-        return self._properties.get("kUSBProductString")
+        return self._properties["kUSBProductString"]
 
     @property
     @override
     def serial_number(self) -> str | None:
-        return self._properties.get("kUSBSerialNumberString")
+        return self._properties["kUSBSerialNumberString"]
 
     @override
     def open_interface(
@@ -433,9 +475,7 @@ class RubiconObjCUsbDevice(UsbBackendDevice):
 
         def on_complete(status: int, bytesTransferred: int) -> None:
             if status:
-                loop.call_soon_threadsafe(
-                    future.set_exception, OSError(status, mach_error_string(status))
-                )
+                loop.call_soon_threadsafe(future.set_exception, mach_error(status))
             else:
                 loop.call_soon_threadsafe(future.set_result, bytesTransferred)
 
@@ -479,14 +519,14 @@ async def _open_monitor() -> AsyncGenerator[Any, UsbMonitor]:
         added_queue: asyncio.Queue[UsbDeviceInfo] = asyncio.Queue()
 
         def on_added(iterator: IOIterator) -> None:
-            for obj in iterator:
+            for obj in iterator.drain():
                 service = obj.as_(IOService)
                 added_queue.put_nowait(_marshal_device_info(service))
 
         removed_queue: asyncio.Queue[str] = asyncio.Queue()
 
         def on_removed(iterator: IOIterator) -> None:
-            for obj in iterator:
+            for obj in iterator.drain():
                 entry = obj.as_(IORegistryEntry)
                 removed_queue.put_nowait(str(entry.id))
 
@@ -516,6 +556,8 @@ async def _open_monitor() -> AsyncGenerator[Any, UsbMonitor]:
             kIOFirstMatchNotification,
             match_dict,
             on_matched,
+            # match_dict is used again below.
+            consume=False,
         )
         stack.callback(iterator.release)
         # Draining the iterator starts the notifications. This will also handle
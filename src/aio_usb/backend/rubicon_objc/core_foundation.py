@@ -19,6 +19,22 @@ class CFTypeRef(ctypes.c_void_p):
     def release(self) -> None:
         CFRelease(self)
 
+    def consume(self) -> int:
+        """
+        Transfers ownership of the reference out of this object.
+
+        This is for passing the reference to functions that consume it without
+        a retain/release pair. This object is set to NULL and won't release the
+        reference when it is deleted.
+
+        Returns:
+            The raw pointer.
+        """
+        ptr = self.value
+        assert ptr, "NULL reference"
+        self.value = 0
+        return ptr
+
     def __del__(self) -> None:
         if self.value:
             self.release()
@@ -2,12 +2,13 @@
 # Copyright (c) 2025 David Lechner <david@pybricks.com>
 
 import ctypes
+from typing import TypeAlias
 
-
-class kern_return_t(ctypes.c_int):
-    """
-    https://developer.apple.com/documentation/driverkit/kern_return_t?language=objc
-    """
+# Plain alias rather than a subclass so that ctypes converts return values to int.
+kern_return_t: TypeAlias = ctypes.c_int32
+"""
+https://developer.apple.com/documentation/driverkit/kern_return_t?language=objc
+"""
 
 
 class natural_t(ctypes.c_uint):
@@ -5,6 +5,7 @@ import ctypes
 from collections.abc import Iterator
 from typing import Protocol, TypeAlias
 
+from ..runtime import bind
 from ._kernel import boolean_t
 from ._object import IOObject, io_object_t
 from ._runtime import IOKitLib
@@ -15,18 +16,47 @@ class IOIterator(IOObject):
     https://developer.apple.com/documentation/iokit/io_iterator_t?language=objc
     """
 
+    # Keeps the C callback of a notification iterator alive for as long as the
+    # iterator. Class attribute since ctypes doesn't call __init__().
+    _notification_callback: object = None
+
     def __iter__(self) -> Iterator[IOObject]:
-        return self
+        # A generator is cheaper to resume than calling a Python __next__()
+        # method and raising StopIteration for each step.
+        next_ = IOIteratorNext
+
+        while (obj := next_(self)) is not None:
+            yield obj
 
-    def __next__(self) -> IOObject:
+        # IOIteratorNext() returns NULL both at the end of the iteration and
+        # when the iterator is invalid, so only check validity in that case.
         if not IOIteratorIsValid(self):
             raise RuntimeError("Iterator is not valid")
 
-        next = IOIteratorNext(self)
-        if next:
-            return next
+    def drain(self) -> list[IOObject]:
+        """
+        Gets all remaining objects from the iterator.
+
+        This is cheaper than iterating one object at a time when all of the
+        objects are needed anyway.
+
+        Returns:
+            A list of the remaining objects.
 
-        raise StopIteration
+        Raises:
+            RuntimeError: If the iterator became invalid.
+        """
+        objects: list[IOObject] = []
+        append = objects.append
+        next_ = IOIteratorNext
+
+        while (obj := next_(self)) is not None:
+            append(obj)
+
+        if not IOIteratorIsValid(self):
+            raise RuntimeError("Iterator is not valid")
+
+        return objects
 
     def reset(self) -> None:
         """
@@ -61,18 +91,19 @@ class _IOIteratorIsValid(Protocol):
         ...
 
 
-IOIteratorIsValid: _IOIteratorIsValid = ctypes.CFUNCTYPE(boolean_t, io_iterator_t)(
-    ("IOIteratorIsValid", IOKitLib), ((1, "iterator"),)
-)
-
-
 def _errcheck_IOIteratorIsValid(
     result: boolean_t, func: _IOIteratorIsValid, args: tuple[io_iterator_t]
 ) -> bool:
     return bool(result)
 
 
-IOIteratorIsValid.errcheck = _errcheck_IOIteratorIsValid  # type: ignore
+IOIteratorIsValid: _IOIteratorIsValid = bind(
+    IOKitLib,
+    "IOIteratorIsValid",
+    boolean_t,
+    [io_iterator_t],
+    _errcheck_IOIteratorIsValid,
+)
 
 
 class _IOIteratorNext(Protocol):
@@ -96,21 +127,17 @@ class _IOIteratorNext(Protocol):
         ...
 
 
-IOIteratorNext: _IOIteratorNext = ctypes.CFUNCTYPE(io_object_t, io_iterator_t)(
-    ("IOIteratorNext", IOKitLib), ((1, "iterator"),)
-)
-
-
 def _errcheck_IOIteratorNext(
-    result: io_object_t, func: _IOIteratorNext, args: tuple[io_iterator_t]
+    result: int, func: _IOIteratorNext, args: tuple[io_iterator_t]
 ) -> io_object_t | None:
-    if result.value == 0:
-        return None
+    # The raw handle is returned as a plain int so that the wrapper object is
+    # only created when there is actually an object.
+    return IOObject(result) if result else None
 
-    return result
 
-
-IOIteratorNext.errcheck = _errcheck_IOIteratorNext  # type: ignore
+IOIteratorNext: _IOIteratorNext = bind(
+    IOKitLib, "IOIteratorNext", ctypes.c_uint, [io_iterator_t], _errcheck_IOIteratorNext
+)
 
 
 class _IOIteratorReset(Protocol):
@@ -129,6 +156,6 @@ class _IOIteratorReset(Protocol):
         ...
 
 
-IOIteratorReset: _IOIteratorReset = ctypes.CFUNCTYPE(None, io_iterator_t)(
-    ("IOIteratorReset", IOKitLib), ((1, "iterator"),)
+IOIteratorReset: _IOIteratorReset = bind(
+    IOKitLib, "IOIteratorReset", None, [io_iterator_t]
 )
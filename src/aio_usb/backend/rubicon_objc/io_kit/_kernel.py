@@ -2,6 +2,7 @@
 # Copyright (c) 2025 David Lechner <david@pybricks.com>
 
 import ctypes
+import threading
 
 
 class boolean_t(ctypes.c_int):
@@ -14,3 +15,16 @@ io_name_t = ctypes.c_char * 128
 """
 https://developer.apple.com/documentation/kernel/io_name_t?language=objc
 """
+
+
+class _NameBuffer(threading.local):
+    """
+    Per-thread :data:`io_name_t` output buffer so we don't have to allocate a
+    new one for every call that returns a name.
+    """
+
+    def __init__(self) -> None:
+        self.buf = io_name_t()
+
+
+name_buffer = _NameBuffer()
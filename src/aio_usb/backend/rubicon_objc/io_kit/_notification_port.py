@@ -5,6 +5,7 @@ import ctypes
 from typing import Protocol, final
 
 from ..dispatch._queue import DispatchQueue, dispatch_queue_t
+from ..runtime import bind
 from ._driver_kit import mach_port_t
 from ._runtime import IOKitLib
 
@@ -20,12 +21,14 @@ class IONotificationPortRef(ctypes.c_void_p):
         return IONotificationPortCreate(port)
 
     def destroy(self) -> None:
-        if self.value:
-            IONotificationPortDestroy(self)
+        notify = self.value
+        if notify:
+            # Clear the pointer before the call so that __del__ can't destroy
+            # the port a second time if something goes wrong.
             self.value = 0
+            IONotificationPortDestroy(notify)
 
-    def __del__(self) -> None:
-        self.destroy()
+    __del__ = destroy
 
     def set_dispatch_queue(self, queue: DispatchQueue) -> None:
         IONotificationPortSetDispatchQueue(self, queue)
@@ -35,26 +38,27 @@ class _IONotificationPortCreate(Protocol):
     def __call__(self, port: int) -> IONotificationPortRef: ...
 
 
-IONotificationPortCreate: _IONotificationPortCreate = ctypes.CFUNCTYPE(
-    IONotificationPortRef, mach_port_t
-)(("IONotificationPortCreate", IOKitLib), ((1, "port"),))
+IONotificationPortCreate: _IONotificationPortCreate = bind(
+    IOKitLib, "IONotificationPortCreate", IONotificationPortRef, [mach_port_t]
+)
 
 
 class _IONotificationPortDestroy(Protocol):
-    def __call__(self, notify: IONotificationPortRef) -> None: ...
+    def __call__(self, notify: IONotificationPortRef | int) -> None: ...
 
 
-IONotificationPortDestroy: _IONotificationPortDestroy = ctypes.CFUNCTYPE(
-    None, IONotificationPortRef
-)(("IONotificationPortDestroy", IOKitLib), ((1, "notify"),))
+IONotificationPortDestroy: _IONotificationPortDestroy = bind(
+    IOKitLib, "IONotificationPortDestroy", None, [IONotificationPortRef]
+)
 
 
 class _IONotificationPortSetDispatchQueue(Protocol):
     def __call__(self, notify: IONotificationPortRef, queue: DispatchQueue) -> None: ...
 
 
-IONotificationPortSetDispatchQueue: _IONotificationPortSetDispatchQueue = (
-    ctypes.CFUNCTYPE(None, IONotificationPortRef, dispatch_queue_t)(
-        ("IONotificationPortSetDispatchQueue", IOKitLib), ((1, "notify"), (1, "queue"))
-    )
+IONotificationPortSetDispatchQueue: _IONotificationPortSetDispatchQueue = bind(
+    IOKitLib,
+    "IONotificationPortSetDispatchQueue",
+    None,
+    [IONotificationPortRef, dispatch_queue_t],
 )
@@ -2,12 +2,13 @@
 # Copyright (c) 2025 David Lechner <david@pybricks.com>
 
 import ctypes
+import functools
 from typing import Protocol, TypeAlias, TypeVar
 
-from ..runtime import mach_error_string
+from ..runtime import bind
 from ._driver_kit import kern_return_t, mach_port_t
-from ._kernel import boolean_t, io_name_t
-from ._runtime import IOKitLib
+from ._kernel import boolean_t, name_buffer
+from ._runtime import IOKitLib, check_kern_return
 
 _TIOObject = TypeVar("_TIOObject", bound="IOObject")
 
@@ -17,14 +18,24 @@ class IOObject(mach_port_t):
     https://developer.apple.com/documentation/iokit/io_object_t?language=objc
     """
 
+    # The class of a kernel object can't change, so it is looked up at most
+    # once per handle. Instances created by ctypes (e.g. return values) don't
+    # call __init__, so the default lives on the class.
+    _class_name: str | None = None
+
     @property
     def class_name(self) -> str:
         """
         Gets the OSMetaClass name of the object.
         """
-        assert self.value != 0, "IOObject is NULL"
-        name = IOObjectGetClass(self)
-        return name.decode("utf-8")
+        if self._class_name is None:
+            assert self.value != 0, "IOObject is NULL"
+            buf = name_buffer.buf
+            IOObjectGetClass(self, buf)
+            # string_at() stops at the first NUL, so we don't copy all 128 bytes.
+            self._class_name = ctypes.string_at(buf).decode("utf-8")
+
+        return self._class_name
 
     @property
     def user_retain_count(self) -> int:
@@ -39,57 +50,107 @@ class IOObject(mach_port_t):
         Checks if this object conforms to the given class name.
         """
         assert self.value != 0, "IOObject is NULL"
-        return bool(IOObjectConformsTo(self, class_name.encode("utf-8")).value)
+
+        if class_name == self._class_name:
+            return True
+
+        return bool(IOObjectConformsTo(self, _class_name_charp(class_name)).value)
 
     def as_(self, cls: type[_TIOObject]) -> _TIOObject:
         """
         Casts this object to a subclass of IOObject.
         """
-        if not self.conforms_to(cls.__name__):
-            raise TypeError(f"Object does not conform to {cls.__name__}")
-
-        if not issubclass(cls, IOObject):  # pyright: ignore[reportUnnecessaryIsInstance]
+        if __debug__ and not issubclass(cls, IOObject):  # pyright: ignore[reportUnnecessaryIsInstance]
             raise TypeError(f"{cls.__name__} is not a subclass of IOObject")
 
-        self.retain()
-        return cls(self.value)
+        assert self.value != 0, "IOObject is NULL"
+
+        name = cls.__name__
+
+        # Calling the FFI functions directly instead of going through
+        # conforms_to() and retain() saves a couple of method calls since this
+        # is called for every object we iterate. If we already know that the
+        # object is exactly this class, it can't fail to conform.
+        if (
+            name != self._class_name
+            and not IOObjectConformsTo(self, _class_name_charp(name)).value
+        ):
+            raise TypeError(f"Object does not conform to {name}")
+
+        IOObjectRetain(self)
+        obj = cls(self.value)
+
+        if self._class_name is not None:
+            obj._class_name = self._class_name
+
+        return obj
 
     def retain(self) -> None:
         assert self.value != 0, "IOObject is NULL"
         IOObjectRetain(self)
 
     def release(self):
-        if self.value != 0:
-            IOObjectRelease(self)
+        handle = self.value
+        if handle:
+            # Clear the handle before the call so that __del__ can't release
+            # the object a second time if the call raises.
             self.value = 0
-
-    def __del__(self):
-        self.release()
+            if self._class_name is not None:
+                self._class_name = None
+            # Also drop the cached IORegistryEntry.name and .id so that they
+            # aren't used after the object is released.
+            self.__dict__.pop("name", None)
+            self.__dict__.pop("id", None)
+            IOObjectRelease(handle)
+
+    # Releasing is the only thing to do on finalization, so use release()
+    # directly instead of adding another call frame for every object.
+    __del__ = release
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, IOObject):
             return NotImplemented
 
-        assert self.value != 0, "IOObject is NULL"
-        assert value.value != 0, "value IOObject is NULL"
+        # The same port name in the same task is always the same kernel object.
+        if self.value == value.value:
+            return True
+
+        # A NULL handle is never equal to a valid one.
+        if not self.value or not value.value:
+            return False
+
         return bool(IOObjectIsEqualTo(self, value).value)
 
 
+@functools.cache
+def _class_name_charp(name: str) -> ctypes.c_char_p:
+    # There are only a handful of class names that we ever check, so keep the
+    # C string around instead of encoding and converting it on every call.
+    return ctypes.c_char_p(name.encode("utf-8"))
+
+
+@functools.cache
+def _key_charp(key: bytes) -> ctypes.c_char_p:
+    # Same as above, but for IOKit keys and names such as plane names and
+    # notification types, which are already bytes.
+    return ctypes.c_char_p(key)
+
+
 # Type alias to match the C type name for use in function signatures to match
 # the Apple documentation.
 io_object_t: TypeAlias = IOObject
 
 
 class _IOObjectGetClass(Protocol):
-    def __call__(self, object: IOObject) -> bytes:
+    def __call__(
+        self, object: IOObject, className: ctypes.Array[ctypes.c_char]
+    ) -> None:
         """
         Return the class name of an IOKit object.
 
         Args:
             object: The IOKit object.
-
-        Returns:
-            The class name of the object.
+            className: Caller allocated buffer to receive the name string.
 
         Raises:
             OSError: A kern_return_t error code.
@@ -100,27 +161,17 @@ class _IOObjectGetClass(Protocol):
         ...
 
 
-IOObjectGetClass: _IOObjectGetClass = ctypes.CFUNCTYPE(
-    kern_return_t, io_object_t, io_name_t
-)(("IOObjectGetClass", IOKitLib), ((1, "object"), (2, "className")))
-
-
-def _errcheck_IOObjectGetClass(
-    result: kern_return_t,
-    func: _IOObjectGetClass,
-    args: tuple[io_object_t, ctypes.Array[ctypes.c_char]],
-) -> bytes:
-    if result.value != 0:
-        raise OSError(result.value, mach_error_string(result.value))
-
-    return args[1].raw.split(b"\0", 1)[0]
-
-
-IOObjectGetClass.errcheck = _errcheck_IOObjectGetClass  # type: ignore
+IOObjectGetClass: _IOObjectGetClass = bind(
+    IOKitLib,
+    "IOObjectGetClass",
+    kern_return_t,
+    [io_object_t, ctypes.c_char_p],
+    check_kern_return(),
+)
 
 
 class _IOObjectRelease(Protocol):
-    def __call__(self, object: IOObject) -> None:
+    def __call__(self, object: IOObject | int) -> None:
         """
         Releases an object handle previously returned by IOKitLib.
 
@@ -140,21 +191,11 @@ class _IOObjectRelease(Protocol):
         ...
 
 
-IOObjectRelease: _IOObjectRelease = ctypes.CFUNCTYPE(kern_return_t, io_object_t)(
-    ("IOObjectRelease", IOKitLib), ((1, "object"),)
+IOObjectRelease: _IOObjectRelease = bind(
+    IOKitLib, "IOObjectRelease", kern_return_t, [io_object_t], check_kern_return()
 )
 
 
-def _errcheck_IOObjectRelease(
-    result: kern_return_t, func: _IOObjectRelease, args: tuple[io_object_t]
-) -> None:
-    if result.value != 0:
-        raise OSError(result.value, mach_error_string(result.value))
-
-
-IOObjectRelease.errcheck = _errcheck_IOObjectRelease  # type: ignore
-
-
 class _IOObjectRetain(Protocol):
     def __call__(self, object: IOObject) -> None:
         """
@@ -174,28 +215,18 @@ class _IOObjectRetain(Protocol):
         ...
 
 
-IOObjectRetain: _IOObjectRetain = ctypes.CFUNCTYPE(kern_return_t, io_object_t)(
-    ("IOObjectRetain", IOKitLib), ((1, "object"),)
+IOObjectRetain: _IOObjectRetain = bind(
+    IOKitLib, "IOObjectRetain", kern_return_t, [io_object_t], check_kern_return()
 )
 
 
-def _errcheck_IOObjectRetain(
-    result: kern_return_t, func: _IOObjectRetain, args: tuple[io_object_t]
-) -> None:
-    if result.value != 0:
-        raise OSError(result.value, mach_error_string(result.value))
-
-
-IOObjectRetain.errcheck = _errcheck_IOObjectRetain  # type: ignore
-
-
 class _IOObjectGetUserRetainCount(Protocol):
     def __call__(self, object: IOObject) -> int: ...
 
 
-IOObjectGetUserRetainCount: _IOObjectGetUserRetainCount = ctypes.CFUNCTYPE(
-    ctypes.c_uint32, io_object_t
-)(("IOObjectGetUserRetainCount", IOKitLib), ((1, "object"),))
+IOObjectGetUserRetainCount: _IOObjectGetUserRetainCount = bind(
+    IOKitLib, "IOObjectGetUserRetainCount", ctypes.c_uint32, [io_object_t]
+)
 
 
 class _IOObjectIsEqualTo(Protocol):
@@ -219,13 +250,15 @@ class _IOObjectIsEqualTo(Protocol):
         ...
 
 
-IOObjectIsEqualTo: _IOObjectIsEqualTo = ctypes.CFUNCTYPE(
-    boolean_t, io_object_t, io_object_t
-)(("IOObjectIsEqualTo", IOKitLib), ((1, "object"), (1, "anObject")))
+IOObjectIsEqualTo: _IOObjectIsEqualTo = bind(
+    IOKitLib, "IOObjectIsEqualTo", boolean_t, [io_object_t, io_object_t]
+)
 
 
 class _IOObjectConformsTo(Protocol):
-    def __call__(self, object: IOObject, className: bytes) -> boolean_t:
+    def __call__(
+        self, object: IOObject, className: bytes | ctypes.c_char_p
+    ) -> boolean_t:
         """
         Performs an OSDynamicCast operation on an IOKit object.
 
@@ -247,6 +280,6 @@ class _IOObjectConformsTo(Protocol):
         ...
 
 
-IOObjectConformsTo: _IOObjectConformsTo = ctypes.CFUNCTYPE(
-    boolean_t, io_object_t, ctypes.c_char_p
-)(("IOObjectConformsTo", IOKitLib), ((1, "object"), (1, "className")))
+IOObjectConformsTo: _IOObjectConformsTo = bind(
+    IOKitLib, "IOObjectConformsTo", boolean_t, [io_object_t, ctypes.c_char_p]
+)
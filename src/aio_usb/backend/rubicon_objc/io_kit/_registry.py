@@ -3,21 +3,24 @@
 
 
 import ctypes
+import functools
 from typing import Any, Protocol, TypeAlias
 
 from rubicon.objc import (
     NSDictionary,
+    ObjCInstance,
+    ns_from_py,  # pyright: ignore[reportUnknownVariableType]
     py_from_ns,  # pyright: ignore[reportUnknownVariableType]
 )
 
-from ..core_foundation import CFAllocatorRef, CFMutableDictionaryRef
-from ..runtime import mach_error_string
+from ..core_foundation import CFAllocatorRef, CFMutableDictionaryRef, CFTypeRef
+from ..runtime import bind, mach_error
 from ._driver_kit import IOOptionBits, kern_return_t
 from ._io_kit_keys import kIOServicePlane
 from ._iterator import IOIterator, io_iterator_t
-from ._kernel import io_name_t
-from ._object import IOObject
-from ._runtime import IOKitLib
+from ._kernel import io_name_t, name_buffer
+from ._object import IOObject, _key_charp
+from ._runtime import IOKitLib, check_kern_return
 
 
 class IORegistryEntry(IOObject):
@@ -34,20 +37,24 @@ class IORegistryEntry(IOObject):
         entry.retain()
         return entry
 
-    @property
+    @functools.cached_property
     def name(self) -> str:
         """
         Gets the name of the registry entry.
+
+        The value is cached since it doesn't change for the lifetime of the entry.
         """
-        name = IORegistryEntryGetName(self)
+        name = IORegistryEntryGetName(self, name_buffer.buf)
         return name.decode("utf-8")
 
-    @property
+    @functools.cached_property
     def id(self) -> int:
         """
         Gets the registry entry ID.
+
+        The value is cached since it doesn't change for the lifetime of the entry.
         """
-        return IORegistryEntryGetRegistryEntryID(self)
+        return IORegistryEntryGetRegistryEntryID(self, ctypes.c_uint64())
 
     @classmethod
     def id_matching(cls, entry_id: int) -> CFMutableDictionaryRef:
@@ -74,11 +81,41 @@ class IORegistryEntry(IOObject):
         Gets the properties of the registry.
         """
         return py_from_ns(
-            NSDictionary(IORegistryEntryCreateCFProperties(self, None, 0))
+            NSDictionary(
+                IORegistryEntryCreateCFProperties(
+                    self, CFMutableDictionaryRef(), None, 0
+                )
+            )
         )
 
+    def get_property(self, key: str) -> Any:
+        """
+        Gets a single property of the registry entry.
+
+        This is cheaper than :attr:`properties` when only a few properties are
+        needed since only the requested value is converted.
+
+        Args:
+            key: The property name.
+
+        Returns:
+            The property value or ``None`` if the entry does not have the property.
+        """
+        ref = IORegistryEntryCreateCFProperty(self, _cf_key(key), None, 0)
+
+        if ref is None:
+            return None
+
+        return py_from_ns(ObjCInstance(ref))
+
     def get_child_iterator(self, plane: bytes = kIOServicePlane) -> IOIterator:
-        return IORegistryEntryGetChildIterator(self, plane)
+        return IORegistryEntryGetChildIterator(self, _key_charp(plane), IOIterator())
+
+
+@functools.cache
+def _cf_key(key: str) -> ObjCInstance:
+    # Property keys are reused for every device, so only create each CFString once.
+    return ns_from_py(key)
 
 
 # Alias to match the C type name for use in function signatures to match
@@ -87,12 +124,15 @@ io_registry_entry_t: TypeAlias = IORegistryEntry
 
 
 class _IORegistryEntryGetName(Protocol):
-    def __call__(self, entry: IORegistryEntry) -> bytes:
+    def __call__(
+        self, entry: IORegistryEntry, name: ctypes.Array[ctypes.c_char]
+    ) -> bytes:
         """
         Returns a C-string name assigned to a registry entry.
 
         Args:
             entry: The registry entry handle whose name to look up.
+            name: The caller's buffer to receive the name.
 
         Returns:
             The name of the entry.
@@ -109,32 +149,36 @@ class _IORegistryEntryGetName(Protocol):
         ...
 
 
-IORegistryEntryGetName: _IORegistryEntryGetName = ctypes.CFUNCTYPE(
-    kern_return_t, io_registry_entry_t, io_name_t
-)(("IORegistryEntryGetName", IOKitLib), ((1, "entry"), (2, "name")))
-
-
 def _errcheck_IORegistryEntryGetName(
-    result: kern_return_t,
+    result: int,
     func: _IORegistryEntryGetName,
     args: tuple[io_registry_entry_t, ctypes.Array[ctypes.c_char]],
 ) -> bytes:
-    if result.value != 0:
-        raise OSError(result.value, mach_error_string(result.value))
+    if result != 0:
+        raise mach_error(result)
 
-    return args[1].raw.split(b"\0", 1)[0]
+    # string_at() stops at the NUL terminator instead of copying the whole
+    # buffer and splitting it.
+    return ctypes.string_at(args[1])
 
 
-IORegistryEntryGetName.errcheck = _errcheck_IORegistryEntryGetName  # type: ignore
+IORegistryEntryGetName: _IORegistryEntryGetName = bind(
+    IOKitLib,
+    "IORegistryEntryGetName",
+    kern_return_t,
+    [io_registry_entry_t, io_name_t],
+    _errcheck_IORegistryEntryGetName,
+)
 
 
 class _IORegistryEntryGetRegistryEntryID(Protocol):
-    def __call__(self, entry: IORegistryEntry) -> int:
+    def __call__(self, entry: IORegistryEntry, entryID: ctypes.c_uint64) -> int:
         """
         Returns an ID for the registry entry that is global to all tasks.
 
         Args:
             entry: The registry entry handle whose ID to look up.
+            entryID: The resulting ID.
 
         Returns:
             The resulting ID.
@@ -153,26 +197,23 @@ class _IORegistryEntryGetRegistryEntryID(Protocol):
         ...
 
 
-IORegistryEntryGetRegistryEntryID: _IORegistryEntryGetRegistryEntryID = (
-    ctypes.CFUNCTYPE(
-        kern_return_t, io_registry_entry_t, ctypes.POINTER(ctypes.c_uint64)
-    )(("IORegistryEntryGetRegistryEntryID", IOKitLib), ((1, "entry"), (2, "entryID")))
-)
-
-
 def _errcheck_IORegistryEntryGetRegistryEntryID(
-    result: kern_return_t,
+    result: int,
     func: _IORegistryEntryGetRegistryEntryID,
     args: tuple[io_registry_entry_t, ctypes.c_uint64],
 ) -> int:
-    if result.value != 0:
-        raise OSError(result.value, mach_error_string(result.value))
+    if result != 0:
+        raise mach_error(result)
 
     return args[1].value
 
 
-IORegistryEntryGetRegistryEntryID.errcheck = (  # type: ignore
-    _errcheck_IORegistryEntryGetRegistryEntryID
+IORegistryEntryGetRegistryEntryID: _IORegistryEntryGetRegistryEntryID = bind(
+    IOKitLib,
+    "IORegistryEntryGetRegistryEntryID",
+    kern_return_t,
+    [io_registry_entry_t, ctypes.POINTER(ctypes.c_uint64)],
+    _errcheck_IORegistryEntryGetRegistryEntryID,
 )
 
 
@@ -200,11 +241,6 @@ class _IORegistryEntryIDMatching(Protocol):
         ...
 
 
-IORegistryEntryIDMatching: _IORegistryEntryIDMatching = ctypes.CFUNCTYPE(
-    ctypes.c_void_p, ctypes.c_uint64
-)(("IORegistryEntryIDMatching", IOKitLib), ((1, "entryID"),))
-
-
 def _errcheck_IORegistryEntryIDMatching(
     result: int,
     func: _IORegistryEntryIDMatching,
@@ -217,13 +253,20 @@ def _errcheck_IORegistryEntryIDMatching(
     return CFMutableDictionaryRef(result)
 
 
-IORegistryEntryIDMatching.errcheck = _errcheck_IORegistryEntryIDMatching  # type: ignore
+IORegistryEntryIDMatching: _IORegistryEntryIDMatching = bind(
+    IOKitLib,
+    "IORegistryEntryIDMatching",
+    ctypes.c_void_p,
+    [ctypes.c_uint64],
+    _errcheck_IORegistryEntryIDMatching,
+)
 
 
 class _IORegistryEntryCreateCFProperties(Protocol):
     def __call__(
         self,
         entry: IORegistryEntry,
+        properties: CFMutableDictionaryRef,
         allocator: None,
         options: int,
     ) -> CFMutableDictionaryRef:
@@ -234,6 +277,9 @@ class _IORegistryEntryCreateCFProperties(Protocol):
             entry:
                 The registry entry handle whose property table to copy.
 
+            properties:
+                Receives the created dictionary.
+
             allocator:
                     The CF allocator to use when creating the CF containers.
 
@@ -258,33 +304,77 @@ class _IORegistryEntryCreateCFProperties(Protocol):
         ...
 
 
-IORegistryEntryCreateCFProperties: _IORegistryEntryCreateCFProperties = (
-    ctypes.CFUNCTYPE(
-        kern_return_t,
+IORegistryEntryCreateCFProperties: _IORegistryEntryCreateCFProperties = bind(
+    IOKitLib,
+    "IORegistryEntryCreateCFProperties",
+    kern_return_t,
+    [
         io_registry_entry_t,
         ctypes.POINTER(CFMutableDictionaryRef),
         CFAllocatorRef,
         IOOptionBits,
-    )(
-        ("IORegistryEntryCreateCFProperties", IOKitLib),
-        ((1, "entry"), (2, "properties"), (1, "allocator"), (1, "options")),
-    )
+    ],
+    check_kern_return(1),
 )
 
 
-def _errcheck_IORegistryEntryCreateCFProperties(
-    result: kern_return_t,
-    func: _IORegistryEntryCreateCFProperties,
-    args: tuple[io_registry_entry_t, CFMutableDictionaryRef, CFAllocatorRef, int],
-) -> CFMutableDictionaryRef:
-    if result.value != 0:
-        raise OSError(result.value, mach_error_string(result.value))
+class _IORegistryEntryCreateCFProperty(Protocol):
+    def __call__(
+        self,
+        entry: IORegistryEntry,
+        key: ObjCInstance,
+        allocator: None,
+        options: int,
+    ) -> CFTypeRef | None:
+        """
+        Create a CF representation of a registry entry's property.
+
+        Args:
+            entry:
+                The registry entry handle whose property to copy.
+
+            key:
+                A CFString specifying the property name.
+
+            allocator:
+                The CF allocator to use when creating the CF container.
+
+            options:
+                No options are currently defined.
+
+        Returns:
+            A CF container is created and returned the caller on success, or
+            ``None`` if the property does not exist. The caller should release
+            with CFRelease.
+
+        This function creates an instantaneous snapshot of a registry entry
+        property, creating a CF container analogue in the caller's task. Not
+        every object available in the kernel is represented as a CF container;
+        currently OSDictionary, OSArray, OSSet, OSSymbol, OSString, OSData,
+        OSNumber, OSBoolean are created as their CF counterparts.
+
+        https://developer.apple.com/documentation/iokit/1514293-ioregistryentrycreatecfproperty?language=objc
+        """
+        ...
+
 
-    return args[1]
+def _errcheck_IORegistryEntryCreateCFProperty(
+    result: int | None,
+    func: _IORegistryEntryCreateCFProperty,
+    args: tuple[io_registry_entry_t, ObjCInstance, CFAllocatorRef, int],
+) -> CFTypeRef | None:
+    if not result:
+        return None
+
+    return CFTypeRef(result)
 
 
-IORegistryEntryCreateCFProperties.errcheck = (  # type: ignore
-    _errcheck_IORegistryEntryCreateCFProperties
+IORegistryEntryCreateCFProperty: _IORegistryEntryCreateCFProperty = bind(
+    IOKitLib,
+    "IORegistryEntryCreateCFProperty",
+    ctypes.c_void_p,
+    [io_registry_entry_t, ctypes.c_void_p, CFAllocatorRef, IOOptionBits],
+    _errcheck_IORegistryEntryCreateCFProperty,
 )
 
 
@@ -292,7 +382,8 @@ class _IORegistryEntryGetChildIterator(Protocol):
     def __call__(
         self,
         entry: IORegistryEntry,
-        plane: bytes,
+        plane: bytes | ctypes.c_char_p,
+        iterator: IOIterator,
     ) -> IOIterator:
         """
         Returns an iterator over a registry entry’s child entries in a plane.
@@ -318,28 +409,10 @@ class _IORegistryEntryGetChildIterator(Protocol):
         ...
 
 
-IORegistryEntryGetChildIterator: _IORegistryEntryGetChildIterator = ctypes.CFUNCTYPE(
+IORegistryEntryGetChildIterator: _IORegistryEntryGetChildIterator = bind(
+    IOKitLib,
+    "IORegistryEntryGetChildIterator",
     kern_return_t,
-    io_registry_entry_t,
-    ctypes.c_char_p,
-    ctypes.POINTER(io_iterator_t),
-)(
-    ("IORegistryEntryGetChildIterator", IOKitLib),
-    ((1, "entry"), (1, "plane"), (2, "iterator")),
-)
-
-
-def _errcheck_IORegistryEntryGetChildIterator(
-    result: kern_return_t,
-    func: _IORegistryEntryGetChildIterator,
-    args: tuple[io_registry_entry_t, bytes, io_iterator_t],
-) -> IOIterator:
-    if result.value != 0:
-        raise OSError(result.value, mach_error_string(result.value))
-
-    return args[2]
-
-
-IORegistryEntryGetChildIterator.errcheck = (  # type: ignore
-    _errcheck_IORegistryEntryGetChildIterator
+    [io_registry_entry_t, ctypes.c_char_p, ctypes.POINTER(io_iterator_t)],
+    check_kern_return(2),
 )
@@ -1,7 +1,6 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 David Lechner <david@pybricks.com>
 
-import ctypes
 from typing import TypeAlias
 
 from ._driver_kit import kern_return_t
@@ -52,9 +51,14 @@ _sub_iokit_vendor_specific = _err_sub(-2)
 _sub_iokit_reserved = _err_sub(-1)
 
 
+_iokit_common = _sys_iokit | _sub_iokit_common
+
+
 def iokit_common_err(ret: int) -> int:
-    # Errors are signed 32-bit values, so can be negative.
-    return ctypes.c_int(_sys_iokit | _sub_iokit_common | ret).value
+    value = _iokit_common | ret
+    # Errors are signed 32-bit values, so can be negative. Sign-extend without
+    # creating a ctypes.c_int for each constant.
+    return value - 0x100000000 if value & 0x80000000 else value
 
 
 # define	iokit_family_err(sub,return)      (_sys_iokit|sub|return)
@@ -1,7 +1,40 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 David Lechner <david@pybricks.com>
 
+from collections.abc import Callable
+from typing import Any
 
 from rubicon.objc.runtime import load_library
 
+from ..runtime import mach_error
+
 IOKitLib = load_library("IOKit")
+
+
+def _errcheck_kern_return(result: int, func: Any, args: tuple[Any, ...]) -> None:
+    if result != 0:
+        raise mach_error(result)
+
+
+def check_kern_return(out_index: int | None = None) -> Callable[..., Any]:
+    """
+    Creates a ctypes errcheck function for functions that return ``kern_return_t``.
+
+    Args:
+        out_index:
+            Index of the argument to return on success, e.g. an output
+            parameter. If ``None``, the function returns ``None``.
+
+    Returns:
+        An errcheck function that raises :class:`OSError` on failure.
+    """
+    if out_index is None:
+        return _errcheck_kern_return
+
+    def errcheck_out(result: int, func: Any, args: tuple[Any, ...]) -> Any:
+        if result != 0:
+            raise mach_error(result)
+
+        return args[out_index]
+
+    return errcheck_out
@@ -4,18 +4,16 @@
 from __future__ import annotations
 
 import ctypes
-import weakref
-from collections.abc import Iterable
-from typing import TYPE_CHECKING, Any, Protocol, TypeAlias
+from typing import TYPE_CHECKING, Protocol, TypeAlias
 
 from ..core_foundation import CFDictionaryRef
 from ..io_kit._kernel import boolean_t
-from ..runtime import mach_error_string
+from ..runtime import bind, mach_error
 from ._driver_kit import kern_return_t, mach_port_t
 from ._iterator import IOIterator, io_iterator_t
 from ._notification_port import IONotificationPortRef
-from ._object import IOObject
-from ._runtime import IOKitLib
+from ._object import IOObject, _key_charp
+from ._runtime import IOKitLib, check_kern_return
 
 kIOPublishNotification = b"IOServicePublish"
 kIOFirstPublishNotification = b"IOServiceFirstPublish"
@@ -62,6 +60,8 @@ class IOService(IOObject):
         notification_type: bytes,
         matching: CFDictionaryRef,
         callback: IOServiceMatchingCallback,
+        *,
+        consume: bool = True,
     ) -> IOIterator:
         # Wrap the callback so that caller doesn't need to know about retaining
         # the iterator.
@@ -75,24 +75,25 @@ class IOService(IOObject):
 
         iterator = IOServiceAddMatchingNotification(
             notify_port,
-            notification_type,
+            _key_charp(notification_type),
             # IOServiceAddMatchingNotification steals reference from matching.
-            matching.retain(),
+            matching.consume() if consume else matching.retain(),
             c_callback,
             # Since Python has closures, we don't need to pass a refCon.
             None,
+            IOIterator(),
         )
 
         # Ensure the C callback is not garbage collected while the iterator
         # exists. When the iterator is released, the notification is removed and
         # the callback will never be called again.
-        weakref.finalize(iterator, list[Any].clear, [c_callback])
+        iterator._notification_callback = c_callback  # pyright: ignore[reportPrivateUsage]
 
         return iterator
 
     @staticmethod
     def get_matching_service(
-        matching: CFDictionaryRef, port: int = 0
+        matching: CFDictionaryRef, port: int = 0, *, consume: bool = True
     ) -> "IOService | None":
         """
         Looks up a registered IOService object that matches a matching dictionary.
@@ -104,17 +105,23 @@ class IOService(IOObject):
                 functions such as :meth:`matching()`, :meth:`name_matching()`.
             port:
                 The primary port obtained from IOMasterPort.
+            consume:
+                If ``True``, the reference owned by ``matching`` is passed on
+                and ``matching`` can't be used again. Otherwise an additional
+                reference is taken.
 
         Returns:
             An IOService object if found, otherwise None.
         """
         # IOServiceGetMatchingService steals reference from matching
-        return IOServiceGetMatchingService(port, matching.retain())
+        return IOServiceGetMatchingService(
+            port, matching.consume() if consume else matching.retain()
+        )
 
     @staticmethod
     def get_matching_services(
-        matching: CFDictionaryRef, port: int = 0
-    ) -> Iterable["IOService"]:
+        matching: CFDictionaryRef, port: int = 0, *, consume: bool = True
+    ) -> list["IOService"]:
         """
         Looks up registered IOService objects that match a matching dictionary.
 
@@ -123,17 +130,29 @@ class IOService(IOObject):
                 A CF dictionary containing matching information. IOKitLib can
                 construct matching dictionaries for common criteria with helper
                 functions such as :meth:`matching()`, :meth:`name_matching()`.
+            port:
+                The primary port obtained from IOMasterPort.
+            consume:
+                If ``True``, the reference owned by ``matching`` is passed on
+                and ``matching`` can't be used again. Otherwise an additional
+                reference is taken.
 
         Returns:
-            An iterator of IOService objects.
+            A list of the matching IOService objects.
         """
         # IOServiceGetMatchingServices steals reference from matching
-        iterator = IOServiceGetMatchingServices(port, matching.retain())
+        iterator = IOServiceGetMatchingServices(
+            port,
+            matching.consume() if consume else matching.retain(),
+            IOIterator(),
+        )
 
         if iterator is None:
-            return iter(())
+            return []
 
-        return (obj.as_(IOService) for obj in iterator)
+        # Drain the iterator up front rather than returning a generator that
+        # makes one IOIteratorNext() call per step.
+        return [obj.as_(IOService) for obj in iterator.drain()]
 
     def match_property_table(self, matching: CFDictionaryRef) -> bool:
         """
@@ -149,7 +168,7 @@ class IOService(IOObject):
         Raises:
             OSError: On failure.
         """
-        return IOServiceMatchPropertyTable(self, matching)
+        return IOServiceMatchPropertyTable(self, matching, boolean_t())
 
 
 # Alias to match the C type name for use in function signatures to match
@@ -161,10 +180,11 @@ class _IOServiceAddMatchingNotification(Protocol):
     def __call__(
         self,
         notifyPort: IONotificationPortRef,
-        notificationType: bytes,
-        matching: CFDictionaryRef,
+        notificationType: bytes | ctypes.c_char_p,
+        matching: CFDictionaryRef | int,
         callback: c_IOServiceMatchingCallback,
         refCon: ctypes.c_void_p | None,
+        notification: IOIterator,
     ) -> IOIterator:
         """
         Look up registered IOService objects that match a matching dictionary,
@@ -211,6 +231,9 @@ class _IOServiceAddMatchingNotification(Protocol):
                 A reference value passed to the callback function when it is called.
                 This parameter may be NULL.
 
+            notification:
+                Receives the iterator handle.
+
         Returns:
             An iterator handle is returned on success, and should be released
             by the caller when the notification is to be destroyed. The
@@ -233,50 +256,26 @@ class _IOServiceAddMatchingNotification(Protocol):
         ...
 
 
-IOServiceAddMatchingNotification: _IOServiceAddMatchingNotification = ctypes.CFUNCTYPE(
+IOServiceAddMatchingNotification: _IOServiceAddMatchingNotification = bind(
+    IOKitLib,
+    "IOServiceAddMatchingNotification",
     kern_return_t,
-    IONotificationPortRef,
-    ctypes.c_char_p,
-    CFDictionaryRef,
-    _IOServiceMatchingCallback,
-    ctypes.c_void_p,
-    ctypes.POINTER(io_iterator_t),
-)(
-    ("IOServiceAddMatchingNotification", IOKitLib),
-    (
-        (1, "notifyPort"),
-        (1, "notificationType"),
-        (1, "matching"),
-        (1, "callback"),
-        (1, "refCon"),
-        (2, "notification"),
-    ),
-)
-
-
-def _errcheck_IOServiceAddMatchingNotification(
-    result: kern_return_t,
-    func: _IOServiceAddMatchingNotification,
-    args: tuple[
+    [
         IONotificationPortRef,
-        bytes,
+        ctypes.c_char_p,
         CFDictionaryRef,
-        c_IOServiceMatchingCallback,
+        _IOServiceMatchingCallback,
         ctypes.c_void_p,
-        io_iterator_t,
+        ctypes.POINTER(io_iterator_t),
     ],
-) -> io_iterator_t:
-    if result.value != 0:
-        raise OSError(result.value, mach_error_string(result.value))
-
-    return args[5]
-
-
-IOServiceAddMatchingNotification.errcheck = _errcheck_IOServiceAddMatchingNotification  # type: ignore
+    check_kern_return(5),
+)
 
 
 class _IOServiceGetMatchingService(Protocol):
-    def __call__(self, mainPort: int, matching: CFDictionaryRef) -> IOService | None:
+    def __call__(
+        self, mainPort: int, matching: CFDictionaryRef | int
+    ) -> IOService | None:
         """
         Look up a registered IOService object that matches a matching dictionary.
 
@@ -309,27 +308,29 @@ class _IOServiceGetMatchingService(Protocol):
         ...
 
 
-IOServiceGetMatchingService: _IOServiceGetMatchingService = ctypes.CFUNCTYPE(
-    io_service_t, mach_port_t, CFDictionaryRef
-)(("IOServiceGetMatchingService", IOKitLib), ((1, "mainPort"), (1, "matching")))
-
-
 def _errcheck_IOServiceGetMatchingService(
-    result: io_service_t,
+    result: int,
     func: _IOServiceGetMatchingService,
     args: tuple[mach_port_t, CFDictionaryRef],
 ) -> IOService | None:
-    if result.value == 0:
-        return None
+    # The raw handle is returned as a plain int so that the wrapper object is
+    # only created when a service was found.
+    return IOService(result) if result else None
 
-    return result
 
-
-IOServiceGetMatchingService.errcheck = _errcheck_IOServiceGetMatchingService  # type: ignore
+IOServiceGetMatchingService: _IOServiceGetMatchingService = bind(
+    IOKitLib,
+    "IOServiceGetMatchingService",
+    ctypes.c_uint,
+    [mach_port_t, CFDictionaryRef],
+    _errcheck_IOServiceGetMatchingService,
+)
 
 
 class _IOServiceGetMatchingServices(Protocol):
-    def __call__(self, mainPort: int, matching: CFDictionaryRef) -> IOIterator | None:
+    def __call__(
+        self, mainPort: int, matching: CFDictionaryRef | int, existing: IOIterator
+    ) -> IOIterator | None:
         """
         Look up registered IOService objects that match a matching dictionary.
 
@@ -347,6 +348,9 @@ class _IOServiceGetMatchingServices(Protocol):
                 for common criteria with helper functions such as
                 IOServiceMatching, IOServiceNameMatching, IOBSDNameMatching.
 
+            existing:
+                Receives the iterator handle.
+
         Returns:
             An iterator handle is returned on success, and should be released by
             the caller when the iteration is finished.
@@ -368,37 +372,31 @@ class _IOServiceGetMatchingServices(Protocol):
         ...
 
 
-IOServiceGetMatchingServices: _IOServiceGetMatchingServices = ctypes.CFUNCTYPE(
-    kern_return_t, mach_port_t, CFDictionaryRef, ctypes.POINTER(io_iterator_t)
-)(
-    ("IOServiceGetMatchingServices", IOKitLib),
-    (
-        (1, "mainPort"),
-        (1, "matching"),
-        (2, "existing"),
-    ),
-)
-
-
 def _errcheck_IOServiceGetMatchingServices(
-    result: kern_return_t,
+    result: int,
     func: _IOServiceGetMatchingServices,
     args: tuple[mach_port_t, CFDictionaryRef, io_iterator_t],
 ) -> io_iterator_t | None:
-    if result.value != 0:
-        raise OSError(result.value, mach_error_string(result.value))
-
-    if args[2].value == 0:
-        return None
+    if result != 0:
+        raise mach_error(result)
 
-    return args[2]
+    iterator = args[2]
+    return iterator if iterator.value else None
 
 
-IOServiceGetMatchingServices.errcheck = _errcheck_IOServiceGetMatchingServices  # type: ignore
+IOServiceGetMatchingServices: _IOServiceGetMatchingServices = bind(
+    IOKitLib,
+    "IOServiceGetMatchingServices",
+    kern_return_t,
+    [mach_port_t, CFDictionaryRef, ctypes.POINTER(io_iterator_t)],
+    _errcheck_IOServiceGetMatchingServices,
+)
 
 
 class _IOServiceMatchPropertyTable(Protocol):
-    def __call__(self, service: IOService, matching: CFDictionaryRef) -> bool:
+    def __call__(
+        self, service: IOService, matching: CFDictionaryRef, matches: boolean_t
+    ) -> bool:
         """
         Match an IOService objects with matching dictionary.
 
@@ -408,6 +406,8 @@ class _IOServiceMatchPropertyTable(Protocol):
             matching:
                 A CF dictionary containing matching information. IOKitLib can
             construct matching dictionaries for common criteria with helper functions such as IOServiceMatching, IOServiceNameMatching, IOBSDNameMatching.
+            matches:
+                Receives the result of the match.
 
         Returns:
             ``True`` if the service matches, ``False`` otherwise.
@@ -420,23 +420,21 @@ class _IOServiceMatchPropertyTable(Protocol):
         ...
 
 
-IOServiceMatchPropertyTable: _IOServiceMatchPropertyTable = ctypes.CFUNCTYPE(
-    kern_return_t, io_service_t, CFDictionaryRef, ctypes.POINTER(boolean_t)
-)(
-    ("IOServiceMatchPropertyTable", IOKitLib),
-    ((1, "service"), (1, "matching"), (2, "matches")),
-)
-
-
 def _errcheck_IOServiceMatchPropertyTable(
-    result: kern_return_t,
+    result: int,
     func: _IOServiceMatchPropertyTable,
     args: tuple[io_service_t, CFDictionaryRef, boolean_t],
 ) -> bool:
-    if result.value != 0:
-        raise OSError(result.value, mach_error_string(result.value))
+    if result != 0:
+        raise mach_error(result)
 
     return bool(args[2].value)
 
 
-IOServiceMatchPropertyTable.errcheck = _errcheck_IOServiceMatchPropertyTable  # type: ignore
+IOServiceMatchPropertyTable: _IOServiceMatchPropertyTable = bind(
+    IOKitLib,
+    "IOServiceMatchPropertyTable",
+    kern_return_t,
+    [io_service_t, CFDictionaryRef, ctypes.POINTER(boolean_t)],
+    _errcheck_IOServiceMatchPropertyTable,
+)
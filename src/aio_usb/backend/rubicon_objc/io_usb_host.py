@@ -1,7 +1,6 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 David Lechner <david@pybricks.com>
 
-import ctypes
 from enum import IntEnum
 
 from rubicon.objc.api import ObjCClass, objc_const
@@ -13,6 +12,7 @@ from aio_usb.backend.rubicon_objc.io_kit.usb.apple_usb_definitions import (
     IOUSBEndpointDescriptorPtr,
     IOUSBInterfaceDescriptorPtr,
 )
+from aio_usb.backend.rubicon_objc.runtime import bind
 
 IOUSBHost = load_library("IOUSBHost")
 
@@ -30,27 +30,22 @@ class IOUSBHostAbortOption(IntEnum):
     Asynchronous = 1
 
 
-IOUSBGetNextInterfaceDescriptor = ctypes.CFUNCTYPE(
+IOUSBGetNextInterfaceDescriptor = bind(
+    IOUSBHost,
+    "IOUSBGetNextInterfaceDescriptor",
     IOUSBInterfaceDescriptorPtr,
-    IOUSBConfigurationDescriptorPtr,
-    IOUSBDescriptorHeaderPtr,
-)(
-    ("IOUSBGetNextInterfaceDescriptor", IOUSBHost),
-    ((1, "configurationDescriptor"), (1, "currentDescriptor")),
+    [IOUSBConfigurationDescriptorPtr, IOUSBDescriptorHeaderPtr],
 )
 
-IOUSBGetNextEndpointDescriptor = ctypes.CFUNCTYPE(
+IOUSBGetNextEndpointDescriptor = bind(
+    IOUSBHost,
+    "IOUSBGetNextEndpointDescriptor",
     IOUSBEndpointDescriptorPtr,
-    IOUSBConfigurationDescriptorPtr,
-    IOUSBInterfaceDescriptorPtr,
-    IOUSBDescriptorHeaderPtr,
-)(
-    ("IOUSBGetNextEndpointDescriptor", IOUSBHost),
-    (
-        (1, "configurationDescriptor"),
-        (1, "interfaceDescriptor"),
-        (1, "currentDescriptor"),
-    ),
+    [
+        IOUSBConfigurationDescriptorPtr,
+        IOUSBInterfaceDescriptorPtr,
+        IOUSBDescriptorHeaderPtr,
+    ],
 )
 
 # Registry property names
@@ -85,9 +80,6 @@ IOUSBHostMatchingPropertyKeyInterfaceSubClass = objc_const(
 IOUSBHostMatchingPropertyKeyInterfaceProtocol = objc_const(
     IOUSBHost, "IOUSBHostMatchingPropertyKeyInterfaceProtocol"
 )
-IOUSBHostMatchingPropertyKeyProductIDMask = objc_const(
-    IOUSBHost, "IOUSBHostMatchingPropertyKeyProductIDMask"
-)
 IOUSBHostMatchingPropertyKeyDeviceClass = objc_const(
     IOUSBHost, "IOUSBHostMatchingPropertyKeyDeviceClass"
 )
@@ -2,7 +2,9 @@
 # Copyright (c) 2025 David Lechner <david@pybricks.com>
 
 import ctypes
-from typing import Protocol, final
+import functools
+from collections.abc import Callable
+from typing import Any, final
 
 from rubicon.objc.runtime import libc, objc_id
 
@@ -20,14 +22,18 @@ class NSErrorError(OSError):
         Args:
             id: ObjC identifier for an NSError object.
         """
-        self._nserror = NSError(id)
-        super().__init__(self._nserror.code, str(self._nserror.localizedDescription))
+        self._nserror = nserror = NSError(id)
+        super().__init__(nserror.code, str(nserror.localizedDescription))
 
-        if self._nserror.localizedFailureReason:
-            self.add_note(str(self._nserror.localizedFailureReason))
+        # Each property access is an Objective-C message send, so only get
+        # each value once.
+        reason = nserror.localizedFailureReason
+        if reason:
+            self.add_note(str(reason))
 
-        if self._nserror.localizedRecoverySuggestion:
-            self.add_note(str(self._nserror.localizedRecoverySuggestion))
+        suggestion = nserror.localizedRecoverySuggestion
+        if suggestion:
+            self.add_note(str(suggestion))
 
     @property
     def nserror(self) -> NSError:
@@ -37,12 +43,56 @@ class NSErrorError(OSError):
         return self._nserror
 
 
-class _mach_error_string(Protocol):
-    def __call__(self, error: int) -> bytes: ...
+def bind(
+    lib: ctypes.CDLL,
+    name: str,
+    restype: Any,
+    argtypes: list[Any],
+    errcheck: Callable[..., Any] | None = None,
+) -> Any:
+    """
+    Looks up a function in a library and sets its C signature.
+
+    Args:
+        lib: The library containing the function.
+        name: The name of the function.
+        restype: The ctypes return type.
+        argtypes: The ctypes argument types.
+        errcheck: Optional ctypes errcheck function.
+
+    Returns:
+        The ctypes function pointer.
+    """
+    func = lib[name]
+    func.restype = restype
+    func.argtypes = argtypes
 
-    """https://developer.apple.com/documentation/kernel/1514686-mach_error_string?language=objc"""
+    if errcheck is not None:
+        func.errcheck = errcheck
 
+    return func
 
-mach_error_string: _mach_error_string = ctypes.CFUNCTYPE(ctypes.c_char_p, ctypes.c_int)(
-    ("mach_error_string", libc), ((1, "error"),)
+
+# https://developer.apple.com/documentation/kernel/1514686-mach_error_string?language=objc
+mach_error_string: Callable[[int], bytes] = bind(
+    libc, "mach_error_string", ctypes.c_char_p, [ctypes.c_int]
 )
+
+
+@functools.lru_cache(maxsize=256)
+def _mach_error_message(error: int) -> str:
+    return mach_error_string(error).decode()
+
+
+def mach_error(error: int) -> OSError:
+    """
+    Creates an :class:`OSError` for a ``kern_return_t`` (or ``IOReturn``) error.
+
+    Args:
+        error: The error code.
+
+    Returns:
+        An exception with :attr:`OSError.errno` set to ``error`` and the
+        message from ``mach_error_string()``.
+    """
+    return OSError(error, _mach_error_message(error))
@@ -4,15 +4,20 @@
 import asyncio
 import ctypes
 import sys
-from collections.abc import AsyncGenerator
+import threading
+from collections import deque
+from collections.abc import AsyncGenerator, Callable
 from contextlib import AbstractAsyncContextManager, ExitStack, asynccontextmanager
-from typing import Any
+from typing import Any, TypeVar
 
 from aio_usb.ch9 import (
     UsbControlRequest,
     UsbDescriptorType,
     UsbDeviceDescriptor,
+    UsbDirection,
+    UsbRecipient,
     UsbRequest,
+    UsbType,
 )
 
 if sys.platform != "win32":
@@ -30,6 +35,8 @@ from aio_usb.backend.provider import BackendProvider
 from aio_usb.device import UsbDevice
 from aio_usb.discovery import UsbDeviceInfo
 
+_T = TypeVar("_T")
+
 # Windows device enumeration AQS (Advanced Query Syntax) conditionals
 
 WINUSB_DEVICE_AQS = (
@@ -66,16 +73,25 @@ ADDITIONAL_PROPERTIES = [
     DEVICE_INTERFACE_CLASSES,
 ]
 
+# bmRequestType for reading the device descriptor
+_GET_DEVICE_DESCRIPTOR_REQUEST_TYPE = int(
+    UsbDirection.IN | UsbType.STANDARD | UsbRecipient.DEVICE
+)
+
 
 def _marshal_device_info(info: wde.DeviceInformation) -> UsbDeviceInfo:
+    # Each access to info.properties is a WinRT call that returns a new map
+    # view, so only get it once.
+    props = info.properties
+
     return UsbDeviceInfo(
         device_id=info.id,
         name=info.name,
-        vendor_id=unbox_uint16(info.properties[USB_VENDOR_ID]),
-        product_id=unbox_uint16(info.properties[USB_PRODUCT_ID]),
-        class_=unbox_uint8(info.properties[USB_CLASS]),
-        subclass=unbox_uint8(info.properties[USB_SUBCLASS]),
-        protocol=unbox_uint8(info.properties[USB_PROTOCOL]),
+        vendor_id=unbox_uint16(props[USB_VENDOR_ID]),
+        product_id=unbox_uint16(props[USB_PRODUCT_ID]),
+        class_=unbox_uint8(props[USB_CLASS]),
+        subclass=unbox_uint8(props[USB_SUBCLASS]),
+        protocol=unbox_uint8(props[USB_PROTOCOL]),
     )
 
 
@@ -85,6 +101,9 @@ class WinRTUsbDevice(UsbBackendDevice):
     ) -> None:
         self._device = device
         self._device_descriptor = device_descriptor
+        # Buffer reused between control transfers. It is taken while a transfer
+        # is in progress so that concurrent transfers don't share it.
+        self._buffer: wss.Buffer | None = None
 
     @property
     @override
@@ -103,10 +122,69 @@ class WinRTUsbDevice(UsbBackendDevice):
         setup.index = request.wIndex
         setup.length = request.wLength
 
-        buf = wss.Buffer(request.wLength)
+        buf, self._buffer = self._buffer, None
+
+        if buf is None or buf.capacity < request.wLength:
+            buf = wss.Buffer(request.wLength)
+
+        buf.length = 0
+
         await self._device.send_control_in_transfer_async(setup, buf)
+        data = bytes(buf)
 
-        return bytes(buf)
+        # Only reuse the buffer after a successful transfer. If the transfer
+        # failed or was cancelled, the operation may still be writing to it.
+        self._buffer = buf
+
+        return data
+
+
+def _threadsafe_put(
+    loop: asyncio.AbstractEventLoop, queue: asyncio.Queue[_T]
+) -> Callable[[_T], None]:
+    """
+    Creates a function that puts items in an asyncio queue from another thread.
+
+    Items that arrive while an earlier put is still waiting for the event loop
+    are added by the same callback, so a burst of events only wakes up the
+    event loop once.
+
+    Args:
+        loop: The event loop that owns ``queue``.
+        queue: The queue to put items in.
+
+    Returns:
+        A function that can be called from any thread.
+    """
+    pending: deque[_T] = deque()
+    lock = threading.Lock()
+    scheduled = False
+
+    def drain() -> None:
+        nonlocal scheduled
+
+        with lock:
+            items = list(pending)
+            pending.clear()
+            scheduled = False
+
+        for item in items:
+            queue.put_nowait(item)
+
+    def put(item: _T) -> None:
+        nonlocal scheduled
+
+        with lock:
+            pending.append(item)
+
+            if scheduled:
+                return
+
+            scheduled = True
+
+        loop.call_soon_threadsafe(drain)
+
+    return put
 
 
 @asynccontextmanager
@@ -121,16 +199,18 @@ async def _open_monitor() -> AsyncGenerator[Any, UsbMonitor]:
 
         added_queue: asyncio.Queue[UsbDeviceInfo] = asyncio.Queue()
 
+        put_added = _threadsafe_put(loop, added_queue)
+
         def on_added(sender: wde.DeviceWatcher, args: wde.DeviceInformation) -> None:
-            info = _marshal_device_info(args)
-            loop.call_soon_threadsafe(added_queue.put_nowait, info)
+            put_added(_marshal_device_info(args))
 
         removed_queue: asyncio.Queue[str] = asyncio.Queue()
+        put_removed = _threadsafe_put(loop, removed_queue)
 
         def on_removed(
             sender: wde.DeviceWatcher, args: wde.DeviceInformationUpdate
         ) -> None:
-            loop.call_soon_threadsafe(removed_queue.put_nowait, args.id)
+            put_removed(args.id)
 
         added_token = watcher.add_added(on_added)
         stack.callback(watcher.remove_added, added_token)
@@ -150,9 +230,9 @@ async def _open_device(device_id: str) -> AsyncGenerator[Any, UsbDevice]:
         # The WinRT API doesn't provide all of the fields we need for the device
         # descriptor, so we have to fetch it manually.
         setup = wdu.UsbSetupPacket()
-        setup.request_type.direction = wdu.UsbTransferDirection.IN
-        setup.request_type.recipient = wdu.UsbControlRecipient.DEVICE
-        setup.request_type.control_transfer_type = wdu.UsbControlTransferType.STANDARD
+        # Set the packed bmRequestType in one property write rather than
+        # looking up and setting the three WinRT enum fields separately.
+        setup.request_type.as_byte = _GET_DEVICE_DESCRIPTOR_REQUEST_TYPE
         setup.request = UsbRequest.GET_DESCRIPTOR
         setup.value = (UsbDescriptorType.DEVICE << 8) | 0
         setup.index = 0
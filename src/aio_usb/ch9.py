@@ -30,8 +30,7 @@ def bcd_to_str(bcd: int) -> str:
     Returns:
         A string representation of the version.
     """
-    major, minor, patch = parse_bcd(bcd)
-    return f"{major}.{minor}.{patch}"
+    return f"{(bcd >> 8) & 0xFF}.{(bcd >> 4) & 0x0F}.{bcd & 0x0F}"
 
 
 class UsbDirection(IntEnum):
@@ -5,13 +5,23 @@ from enum import IntEnum
 
 from typing_extensions import Self, override
 
+# Pseudo-members created for unknown values, so that each one is only created
+# once. Can't be a class attribute since it would become an enum member.
+_unknown_members: dict[tuple[type, object], IntEnum] = {}
+
 
 class _IntEnumWithMissing(IntEnum):
     @classmethod
     def _missing_(cls, value: object) -> Self:
-        member = int.__new__(cls, value)  # type: ignore[call-overload]
-        member._name_ = "[unknown]"
-        return member
+        key = (cls, value)
+        member = _unknown_members.get(key)
+
+        if member is None:
+            member = int.__new__(cls, value)  # type: ignore[call-overload]
+            member._name_ = "[unknown]"
+            _unknown_members[key] = member
+
+        return member  # type: ignore[return-value]
 
 
 class UsbProtocol(_IntEnumWithMissing):
@@ -115,23 +125,23 @@ class UsbSubclassMiscellaneous(UsbSubclass):
 
     @override
     def get_protocol(self, protocol: int) -> UsbProtocol:
-        match self:
-            case UsbSubclassMiscellaneous.SYNC:
-                return UsbSyncProtocol(protocol)
-            case UsbSubclassMiscellaneous.SC2:
-                return UsbSc2Protocol(protocol)
-            case UsbSubclassMiscellaneous.SC3:
-                return UsbSc3Protocol(protocol)
-            case UsbSubclassMiscellaneous.RNDIS:
-                return UsbRndisProtocol(protocol)
-            case UsbSubclassMiscellaneous.USB3_VISION:
-                return Usb3VisionProtocol(protocol)
-            case UsbSubclassMiscellaneous.STEP:
-                return UsbStepProtocol(protocol)
-            case UsbSubclassMiscellaneous.SC7:
-                return UsbSc7Protocol(protocol)
-            case _:
-                return super().get_protocol(protocol)
+        protocol_type = _MISC_PROTOCOLS.get(self)
+
+        if protocol_type is None:
+            return super().get_protocol(protocol)
+
+        return protocol_type(protocol)
+
+
+_MISC_PROTOCOLS: dict[UsbSubclassMiscellaneous, type[UsbProtocol]] = {
+    UsbSubclassMiscellaneous.SYNC: UsbSyncProtocol,
+    UsbSubclassMiscellaneous.SC2: UsbSc2Protocol,
+    UsbSubclassMiscellaneous.SC3: UsbSc3Protocol,
+    UsbSubclassMiscellaneous.RNDIS: UsbRndisProtocol,
+    UsbSubclassMiscellaneous.USB3_VISION: Usb3VisionProtocol,
+    UsbSubclassMiscellaneous.STEP: UsbStepProtocol,
+    UsbSubclassMiscellaneous.SC7: UsbSc7Protocol,
+}
 
 
 class UsbClass(_IntEnumWithMissing):
@@ -175,8 +185,9 @@ class UsbClass(_IntEnumWithMissing):
         Args:
             subclass: The subclass code.
         """
-        match self:
-            case UsbClass.MISC:
-                return UsbSubclassMiscellaneous(subclass)
-            case _:
-                return _UsbUnknownSubclass(subclass)
+        return _SUBCLASSES.get(self, _UsbUnknownSubclass)(subclass)
+
+
+_SUBCLASSES: dict[UsbClass, type[UsbSubclass]] = {
+    UsbClass.MISC: UsbSubclassMiscellaneous,
+}
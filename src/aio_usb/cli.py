@@ -5,6 +5,7 @@ import argparse
 import asyncio
 import ctypes
 import importlib.metadata
+import io
 import sys
 
 from aio_usb import UsbDevice, find_usb_devices, open_usb_device
@@ -12,16 +13,27 @@ from aio_usb.ch9 import (
     UsbBosDescriptor,
     UsbConfigAttributes,
     UsbConfigDescriptor,
-    UsbDescriptorHeader,
     UsbDescriptorType,
     UsbDevCapHeader,
     UsbEndpointDescriptor,
     UsbInterfaceDescriptor,
     bcd_to_str,
-    parse_bcd,
 )
 from aio_usb.class_codes import UsbClass
 
+_CONFIG_DESCRIPTOR_SIZE = ctypes.sizeof(UsbConfigDescriptor)
+_BOS_DESCRIPTOR_SIZE = ctypes.sizeof(UsbBosDescriptor)
+
+# bmAttributes bits as plain ints since bitwise operations on IntFlag members
+# create new IntFlag objects.
+_ONE = int(UsbConfigAttributes.ONE)
+_SELF_POWERED = int(UsbConfigAttributes.SELF_POWERED)
+_CAN_WAKEUP = int(UsbConfigAttributes.CAN_WAKEUP)
+_BATTERY_POWERED = int(UsbConfigAttributes.BATTERY_POWERED)
+
+# Endpoint transfer types indexed by bits 1..0 of bmAttributes
+_ENDPOINT_TYPE_NAMES = ("Control", "Isochronous", "Bulk", "Interrupt")
+
 
 class Args(argparse.Namespace):
     verbose: bool
@@ -48,6 +60,16 @@ def vendor_product_id(value: str) -> tuple[int | None, int | None]:
         ) from e
 
 
+async def get_string(device: UsbDevice, index: int, lang_id: int) -> str:
+    """
+    Get a string descriptor or an empty string if there is no string.
+    """
+    if not index:
+        return ""
+
+    return await device.get_string(index, lang_id)
+
+
 async def print_device_descriptor(device: UsbDevice, lang_id: int) -> None:
     """
     Pretty-print the device descriptor.
@@ -68,20 +90,22 @@ async def print_device_descriptor(device: UsbDevice, lang_id: int) -> None:
     print(f"  idVendor         0x{dd.idVendor:04x}")
     print(f"  idProduct        0x{dd.idProduct:04x}")
     print(f"  bcdDevice       {bcd_to_str(dd.bcdDevice):>7s}")
-    mfg = await device.get_string(dd.iManufacturer, lang_id) if dd.iManufacturer else ""
+    # Request the strings concurrently rather than waiting for each one in turn.
+    mfg, product, serial = await asyncio.gather(
+        get_string(device, dd.iManufacturer, lang_id),
+        get_string(device, dd.iProduct, lang_id),
+        get_string(device, dd.iSerialNumber, lang_id),
+    )
     print(f"  iManufacturer      {dd.iManufacturer: 4d}  {mfg}")
-    product = await device.get_string(dd.iProduct, lang_id) if dd.iProduct else ""
     print(f"  iProduct           {dd.iProduct: 4d}  {product}")
-    serial = (
-        await device.get_string(dd.iSerialNumber, lang_id) if dd.iSerialNumber else ""
-    )
     print(f"  iSerialNumber      {dd.iSerialNumber: 4d}  {serial}")
     print(f"  bNumConfigurations {dd.bNumConfigurations: 4d}")
 
     for i in range(dd.bNumConfigurations):
         await print_config_descriptor(i, device, lang_id)
 
-    if parse_bcd(dd.bcdUSB) >= (2, 1):
+    # BCD values compare in the same order as the versions they encode
+    if dd.bcdUSB >= 0x0210:
         await print_bos_descriptor(device)
 
 
@@ -92,7 +116,7 @@ async def print_config_descriptor(index: int, device: UsbDevice, lang_id: int) -
     config_data = await device.get_config_descriptor(index)
 
     config = UsbConfigDescriptor.from_buffer_copy(config_data)
-    offset = ctypes.sizeof(UsbConfigDescriptor)
+    offset = _CONFIG_DESCRIPTOR_SIZE
 
     print("  Configuration Descriptor:")
     print(f"    bLength             {config.bLength: 4d}")
@@ -106,25 +130,32 @@ async def print_config_descriptor(index: int, device: UsbDevice, lang_id: int) -
         config_str = ""
     print(f"    iConfiguration      {config.iConfiguration: 4d}  {config_str}")
     print(f"    bmAttributes        0x{config.bmAttributes:02X}")
-    config_attrs = UsbConfigAttributes(config.bmAttributes)
+    config_attrs = config.bmAttributes
     config_attr_descs: list[str] = []
-    if not (config_attrs & UsbConfigAttributes.ONE):
+    if not (config_attrs & _ONE):
         config_attr_descs.append("(Warning: bit 7 not set)")
-    if config_attrs & UsbConfigAttributes.SELF_POWERED:
+    if config_attrs & _SELF_POWERED:
         config_attr_descs.append("(Self Powered)")
     else:
         config_attr_descs.append("(Bus Powered)")
-    if config_attrs & UsbConfigAttributes.CAN_WAKEUP:
+    if config_attrs & _CAN_WAKEUP:
         config_attr_descs.append("(Remote Wakeup)")
-    if config_attrs & UsbConfigAttributes.BATTERY_POWERED:
+    if config_attrs & _BATTERY_POWERED:
         config_attr_descs.append("(Battery Powered)")
     print(f"      {' '.join(config_attr_descs)}")
     print(f"    bMaxPower           {config.bMaxPower: 4d}  {config.bMaxPower * 2} mA")
 
-    while offset < config.wTotalLength:
-        header = UsbDescriptorHeader.from_buffer_copy(config_data, offset)
+    # Fields of ctypes structures are slower to read than locals, so don't read
+    # the total length again for every descriptor.
+    total_length = config.wTotalLength
 
-        match header.bDescriptorType:
+    while offset < total_length:
+        # Only the two header bytes are needed to walk the descriptors, so read
+        # them directly instead of creating a UsbDescriptorHeader each time.
+        b_length = config_data[offset]
+        b_descriptor_type = config_data[offset + 1]
+
+        match b_descriptor_type:
             case UsbDescriptorType.INTERFACE:
                 iface = UsbInterfaceDescriptor.from_buffer_copy(config_data, offset)
                 await print_interface_descriptor(iface, device, lang_id)
@@ -135,28 +166,28 @@ async def print_config_descriptor(index: int, device: UsbDevice, lang_id: int) -
                 match iface.bInterfaceClass:  # pyright: ignore[reportPossiblyUnboundVariable]
                     case UsbClass.HID:
                         print("      HID Descriptor:")
-                        print(f"        bLength          {header.bLength: 4d}")
-                        print(f"        bDescriptorType  {header.bDescriptorType: 4d}")
+                        print(f"        bLength          {b_length: 4d}")
+                        print(f"        bDescriptorType  {b_descriptor_type: 4d}")
                         # TODO: finish HID descriptor
                     case UsbClass.SMART_CARD:
                         print("      Smart Card Descriptor:")
-                        print(f"        bLength          {header.bLength: 4d}")
-                        print(f"        bDescriptorType  {header.bDescriptorType: 4d}")
+                        print(f"        bLength          {b_length: 4d}")
+                        print(f"        bDescriptorType  {b_descriptor_type: 4d}")
                         # TODO: finish Smart Card descriptor
                     case _:
                         print("      Unknown Class-Specific Device Descriptor:")
-                        print(f"        bLength          {header.bLength: 4d}")
+                        print(f"        bLength          {b_length: 4d}")
                         print(
-                            f"        bDescriptorType  {header.bDescriptorType: 4d}  (0x{header.bDescriptorType:02X})"
+                            f"        bDescriptorType  {b_descriptor_type: 4d}  (0x{b_descriptor_type:02X})"
                         )
             case _:
                 print("      Unknown Descriptor:")
-                print(f"        bLength          {header.bLength: 4d}")
+                print(f"        bLength          {b_length: 4d}")
                 print(
-                    f"        bDescriptorType  {header.bDescriptorType: 4d}  (0x{header.bDescriptorType:02X})"
+                    f"        bDescriptorType  {b_descriptor_type: 4d}  (0x{b_descriptor_type:02X})"
                 )
 
-        offset += header.bLength
+        offset += b_length
 
 
 async def print_interface_descriptor(
@@ -196,18 +227,7 @@ async def print_endpoint_descriptor(endpoint: UsbEndpointDescriptor) -> None:
     print(
         f"        bEndpointAddress 0x{endpoint.bEndpointAddress:02X}  EP {ep_num} {ep_dir}"
     )
-    ep_type = endpoint.bmAttributes & 0x03
-    match ep_type:
-        case 0:
-            ep_type_str = "Control"
-        case 1:
-            ep_type_str = "Isochronous"
-        case 2:
-            ep_type_str = "Bulk"
-        case 3:
-            ep_type_str = "Interrupt"
-        case _:
-            ep_type_str = "Unknown"
+    ep_type_str = _ENDPOINT_TYPE_NAMES[endpoint.bmAttributes & 0x03]
     print(f"        bmAttributes     0x{endpoint.bmAttributes:02X}  ({ep_type_str})")
     print(f"        wMaxPacketSize   {endpoint.wMaxPacketSize: 4d}")
     print(f"        bInterval        {endpoint.bInterval: 4d}")
@@ -227,7 +247,7 @@ async def print_bos_descriptor(device: UsbDevice) -> None:
     print(f"  wTotalLength     {bos.wTotalLength: 6d}")
     print(f"  bNumDeviceCaps     {bos.bNumDeviceCaps: 4d}")
 
-    offset = ctypes.sizeof(UsbBosDescriptor)
+    offset = _BOS_DESCRIPTOR_SIZE
 
     for _ in range(bos.bNumDeviceCaps):
         cap = UsbDevCapHeader.from_buffer_copy(bos_data, offset)
@@ -254,6 +274,8 @@ async def list_usb_devices(args: Args) -> int:
                 lang_ids = await device.get_lang_ids()
                 await print_device_descriptor(device, lang_ids[0])
 
+        sys.stdout.flush()
+
     return 0
 
 
@@ -281,6 +303,11 @@ def main():
     )
     args = parser.parse_args(namespace=Args())
 
+    # The descriptor dumps print many short lines. Instead of writing each line
+    # separately when stdout is a terminal, output is flushed once per device.
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=False)
+
     exit(asyncio.run(list_usb_devices(args)))
 
 
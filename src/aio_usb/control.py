@@ -11,10 +11,18 @@ from aio_usb.ch9 import (
     UsbType,
 )
 
+# bmRequestType values used below. Combining the enum members is relatively
+# slow, so it is only done once.
+_IN_STANDARD_DEVICE = int(UsbDirection.IN | UsbType.STANDARD | UsbRecipient.DEVICE)
+_OUT_STANDARD_DEVICE = int(UsbDirection.OUT | UsbType.STANDARD | UsbRecipient.DEVICE)
+
+# High byte of wValue for string descriptor requests
+_STRING_DESCRIPTOR_VALUE = UsbDescriptorType.STRING << 8
+
 
 def get_status() -> UsbControlRequest:
     return UsbControlRequest(
-        bmRequestType=UsbDirection.IN | UsbType.STANDARD | UsbRecipient.DEVICE,
+        bmRequestType=_IN_STANDARD_DEVICE,
         bRequest=UsbRequest.GET_STATUS,
         wLength=2,
     )
@@ -24,7 +32,7 @@ def get_descriptor(
     descriptor_type: int, descriptor_index: int, length: int
 ) -> UsbControlRequest:
     return UsbControlRequest(
-        bmRequestType=UsbDirection.IN | UsbType.STANDARD | UsbRecipient.DEVICE,
+        bmRequestType=_IN_STANDARD_DEVICE,
         bRequest=UsbRequest.GET_DESCRIPTOR,
         wValue=(descriptor_type << 8) | descriptor_index,
         wLength=length,
@@ -33,7 +41,7 @@ def get_descriptor(
 
 def set_descriptor(descriptor_type: int, descriptor_index: int) -> UsbControlRequest:
     return UsbControlRequest(
-        bmRequestType=UsbDirection.OUT | UsbType.STANDARD | UsbRecipient.DEVICE,
+        bmRequestType=_OUT_STANDARD_DEVICE,
         bRequest=UsbRequest.SET_DESCRIPTOR,
         wValue=(descriptor_type << 8) | descriptor_index,
     )
@@ -41,9 +49,9 @@ def set_descriptor(descriptor_type: int, descriptor_index: int) -> UsbControlReq
 
 def get_string_descriptor(index: int, lang_id: int, length: int) -> UsbControlRequest:
     return UsbControlRequest(
-        bmRequestType=UsbDirection.IN | UsbType.STANDARD | UsbRecipient.DEVICE,
+        bmRequestType=_IN_STANDARD_DEVICE,
         bRequest=UsbRequest.GET_DESCRIPTOR,
-        wValue=(UsbDescriptorType.STRING << 8) | index,
+        wValue=_STRING_DESCRIPTOR_VALUE | index,
         wIndex=lang_id,
         wLength=length,
     )
@@ -51,16 +59,16 @@ def get_string_descriptor(index: int, lang_id: int, length: int) -> UsbControlRe
 
 def set_string_descriptor(index: int, lang_id: int) -> UsbControlRequest:
     return UsbControlRequest(
-        bmRequestType=UsbDirection.OUT | UsbType.STANDARD | UsbRecipient.DEVICE,
+        bmRequestType=_OUT_STANDARD_DEVICE,
         bRequest=UsbRequest.SET_DESCRIPTOR,
-        wValue=(UsbDescriptorType.STRING << 8) | index,
+        wValue=_STRING_DESCRIPTOR_VALUE | index,
         wIndex=lang_id,
     )
 
 
 def get_configuration() -> UsbControlRequest:
     return UsbControlRequest(
-        bmRequestType=UsbDirection.IN | UsbType.STANDARD | UsbRecipient.DEVICE,
+        bmRequestType=_IN_STANDARD_DEVICE,
         bRequest=UsbRequest.GET_CONFIGURATION,
         wLength=1,
     )
@@ -68,7 +76,7 @@ def get_configuration() -> UsbControlRequest:
 
 def set_configuration(configuration_value: int) -> UsbControlRequest:
     return UsbControlRequest(
-        bmRequestType=UsbDirection.OUT | UsbType.STANDARD | UsbRecipient.DEVICE,
+        bmRequestType=_OUT_STANDARD_DEVICE,
         bRequest=UsbRequest.SET_CONFIGURATION,
         wValue=configuration_value,
     )
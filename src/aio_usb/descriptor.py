@@ -1,7 +1,8 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 David Lechner <david@pybricks.com>
 
-import struct
+import sys
+from array import array
 
 # Language ID for English (United States)
 
@@ -9,12 +10,17 @@ LANGID_EN_US = 0x0409
 
 
 class StringLangIdDescriptor:
+    __slots__ = ("descriptor_type", "langids", "length")
+
     def __init__(self, data: bytes) -> None:
         self.length = data[0]
         self.descriptor_type = data[1]
-        self.langids: list[int] = list(
-            struct.unpack_from(f"<{(self.length - 2) // 2}H", data, 2)
-        )
+        # The format string would be different for each number of IDs, so use
+        # an array instead of struct.
+        langids = array("H", data[2 : 2 + (self.length - 2) // 2 * 2])
+        if sys.byteorder != "little":
+            langids.byteswap()
+        self.langids: list[int] = langids.tolist()
 
     def __repr__(self) -> str:
         return (
@@ -26,6 +32,8 @@ class StringLangIdDescriptor:
 
 
 class StringDescriptor:
+    __slots__ = ("descriptor_type", "length", "string")
+
     def __init__(self, data: bytes) -> None:
         self.length = data[0]
         self.descriptor_type = data[1]
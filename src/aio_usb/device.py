@@ -2,6 +2,7 @@
 # Copyright (c) 2025 David Lechner <david@pybricks.com>
 
 import ctypes
+import struct
 from contextlib import AbstractAsyncContextManager
 from typing import overload
 
@@ -19,18 +20,28 @@ from aio_usb.control import get_descriptor, get_string_descriptor
 from aio_usb.descriptor import StringDescriptor, StringLangIdDescriptor
 from aio_usb.interface import UsbInterface
 
+# wTotalLength field at the same offset in the configuration and BOS descriptors
+_W_TOTAL_LENGTH = struct.Struct("<2xH")
+
 
 class UsbDevice:
     """
     A USB device.
     """
 
+    __slots__ = ("_backend", "_bos_descriptor", "_config_descriptors", "_strings")
+
     def __init__(self, backend: UsbBackendDevice) -> None:
         """
         Args:
             backend: The backend-specific device object.
         """
         self._backend = backend
+        # Descriptors don't change while the device is connected, so they are
+        # only read from the device once.
+        self._config_descriptors: dict[int, bytes] = {}
+        self._bos_descriptor: bytes | None = None
+        self._strings: dict[tuple[int, int], str] = {}
 
     @property
     def vendor_id(self) -> int:
@@ -190,6 +201,11 @@ class UsbDevice:
             The raw configuration descriptor data.
         """
 
+        data = self._config_descriptors.get(index)
+
+        if data is not None:
+            return data
+
         data = await self.control_transfer_in(
             get_descriptor(
                 UsbDescriptorType.CONFIGURATION,
@@ -198,12 +214,14 @@ class UsbDevice:
             ),
         )
 
-        desc = UsbConfigDescriptor.from_buffer_copy(data)
+        (total_length,) = _W_TOTAL_LENGTH.unpack_from(data)
 
         data = await self.control_transfer_in(
-            get_descriptor(UsbDescriptorType.CONFIGURATION, index, desc.wTotalLength)
+            get_descriptor(UsbDescriptorType.CONFIGURATION, index, total_length)
         )
 
+        self._config_descriptors[index] = data
+
         return data
 
     async def get_lang_ids(self, num: int = 1) -> list[int]:
@@ -239,12 +257,20 @@ class UsbDevice:
 
         assert index != 0, "String index 0 is reserved"
 
+        key = (index, lang_id)
+        string = self._strings.get(key)
+
+        if string is not None:
+            return string
+
         data = await self.control_transfer_in(
             get_string_descriptor(index, lang_id, 255)
         )
 
         desc = StringDescriptor(data)
 
+        self._strings[key] = desc.string
+
         return desc.string
 
     async def get_bos_descriptor(self) -> bytes:
@@ -255,14 +281,19 @@ class UsbDevice:
             The raw BOS descriptor data.
         """
 
+        if self._bos_descriptor is not None:
+            return self._bos_descriptor
+
         data = await self.control_transfer_in(
             get_descriptor(UsbDescriptorType.BOS, 0, ctypes.sizeof(UsbBosDescriptor)),
         )
 
-        bos = UsbBosDescriptor.from_buffer_copy(data)
+        (total_length,) = _W_TOTAL_LENGTH.unpack_from(data)
 
         data = await self.control_transfer_in(
-            get_descriptor(UsbDescriptorType.BOS, 0, bos.wTotalLength),
+            get_descriptor(UsbDescriptorType.BOS, 0, total_length),
         )
 
+        self._bos_descriptor = data
+
         return data
@@ -70,3 +70,6 @@ class UsbDeviceInfo:
             return NotImplemented
 
         return self.device_id == other.device_id
+
+    def __hash__(self) -> int:
+        return hash(self.device_id)
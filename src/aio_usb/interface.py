@@ -14,6 +14,8 @@ class UsbInterface:
     A USB interface that has been opened for communication.
     """
 
+    __slots__ = ("_backend",)
+
     def __init__(self, backend: UsbBackendInterface) -> None:
         self._backend = backend
 
@@ -1,6 +1,9 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 David Lechner <david@pybricks.com>
 
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
 from typing import final
 
 from aio_usb.backend.pipe import UsbBackendInPipe, UsbBackendOutPipe
@@ -12,12 +15,90 @@ class UsbInPipe:
     A USB IN pipe (bulk or interrupt endpoint).
     """
 
+    __slots__ = ("_backend",)
+
     def __init__(self, backend: UsbBackendInPipe) -> None:
         self._backend = backend
 
     async def transfer(self, length: int) -> bytes:
         return await self._backend.transfer(length=length)
 
+    async def transfer_many(self, lengths: Iterable[int]) -> list[bytes]:
+        """
+        Queues several transfers at once.
+
+        All transfers are submitted before waiting for any of them, so the
+        endpoint always has a request ready instead of idling between
+        transfers.
+
+        Args:
+            lengths: The length of each transfer.
+
+        Returns:
+            The data received by each transfer, in the same order as ``lengths``.
+
+        Raises:
+            ExceptionGroup:
+                If any transfer fails. The remaining transfers are cancelled.
+        """
+        transfer = self._backend.transfer
+
+        # TaskGroup cancels the remaining transfers if any of them fails, so
+        # that none are left running after this returns.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(transfer(length=length)) for length in lengths]
+
+        return [task.result() for task in tasks]
+
+    async def iter_transfers(
+        self, length: int, *, prefetch: int = 8
+    ) -> AsyncIterator[bytes]:
+        """
+        Continuously receives data from the pipe.
+
+        Up to ``prefetch`` transfers are kept queued on the endpoint so that
+        the device never has to wait for the next request. Each time a
+        transfer completes, another one is queued to replace it.
+
+        Transfers that are still queued when the generator is closed are
+        cancelled, so any data they would have received is discarded. Leaving
+        an ``async for`` loop early does not close the generator, so use
+        :func:`contextlib.aclosing` to make sure that no transfers are left
+        queued until the generator is garbage collected::
+
+            async with contextlib.aclosing(pipe.iter_transfers(64)) as it:
+                async for data in it:
+                    if done(data):
+                        break
+
+        Args:
+            length: The length of each transfer.
+            prefetch: The number of transfers to keep queued.
+
+        Yields:
+            The data received by each transfer, in order.
+        """
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+
+        transfer = self._backend.transfer
+        pending = deque(
+            asyncio.create_task(transfer(length=length)) for _ in range(prefetch)
+        )
+
+        try:
+            while True:
+                data = await pending.popleft()
+                pending.append(asyncio.create_task(transfer(length=length)))
+                yield data
+        finally:
+            for task in pending:
+                task.cancel()
+
+            # Wait for the cancellations so transfers don't outlive the
+            # generator. Errors from aborted transfers are expected here.
+            await asyncio.gather(*pending, return_exceptions=True)
+
 
 @final
 class UsbOutPipe:
@@ -25,8 +106,37 @@ class UsbOutPipe:
     A USB OUT pipe (bulk or interrupt endpoint).
     """
 
+    __slots__ = ("_backend",)
+
     def __init__(self, backend: UsbBackendOutPipe) -> None:
         self._backend = backend
 
     async def transfer(self, data: bytes) -> int:
         return await self._backend.transfer(data=data)
+
+    async def transfer_many(self, chunks: Iterable[bytes]) -> list[int]:
+        """
+        Queues several transfers at once.
+
+        All transfers are submitted before waiting for any of them, so the
+        endpoint always has data ready instead of idling between transfers.
+
+        Args:
+            chunks: The data to send in each transfer.
+
+        Returns:
+            The number of bytes sent by each transfer, in the same order as
+            ``chunks``.
+
+        Raises:
+            ExceptionGroup:
+                If any transfer fails. The remaining transfers are cancelled.
+        """
+        transfer = self._backend.transfer
+
+        # TaskGroup cancels the remaining transfers if any of them fails, so
+        # that none are left running after this returns.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(transfer(data=data)) for data in chunks]
+
+        return [task.result() for task in tasks]
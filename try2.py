@@ -14,16 +14,18 @@ async def main() -> None:
         tg = await aenter(asyncio.TaskGroup())
 
         async def watch_added():
-            async for device in monitor.added():
-                devices[device.device_id] = device.name
-                print("Device connected:", device.name)
+            async for batch in monitor.added_batches():
+                for device in batch:
+                    devices[device.device_id] = device.name
+                    print("Device connected:", device.name)
 
         tg.create_task(watch_added())
 
         async def watch_removed():
-            async for device_id in monitor.removed():
-                name = devices.pop(device_id, device_id)
-                print("Device disconnected:", name)
+            async for batch in monitor.removed_batches():
+                for device_id in batch:
+                    name = devices.pop(device_id, device_id)
+                    print("Device disconnected:", name)
 
         tg.create_task(watch_removed())
 